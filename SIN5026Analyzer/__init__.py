@@ -1,26 +1,68 @@
+import atexit
 import logging
 import os
 import datetime as dt
 import logging.handlers
+import queue
 
 
-# Start the logging module
-
-log_base_dir = 'logs'
-if os.path.isdir(log_base_dir) is False:
-    os.makedirs(log_base_dir)
-log_filename = os.path.join(log_base_dir, 'SIN5026Analyzer_{tm}.log'.format(tm=dt.datetime.now().date().strftime('%Y%m%d')))
+# The package logger does nothing until the application calls setup_logging()
 
 log = logging.getLogger(__name__)
-log.setLevel(level=logging.DEBUG)
-
-formatter_stream_file = logging.Formatter('[*] %(asctime)s - %(name)s - %(levelname)s - %(message)s')
-log_stream_handler = logging.StreamHandler()
-log_stream_handler.setLevel(logging.INFO)
-log_stream_handler.setFormatter(formatter_stream_file)
-log_file_handler = logging.FileHandler(log_filename)
-log_file_handler.setLevel(logging.DEBUG)
-log_file_handler.setFormatter(formatter_stream_file)
-
-log.addHandler(log_stream_handler)
-log.addHandler(log_file_handler)
+log.addHandler(logging.NullHandler())
+
+_log_listener = None
+
+
+def setup_logging(log_base_dir: str = 'logs', stream_level: int = logging.INFO, file_level: int = logging.DEBUG):
+    """
+    Configure the package logger to write to the console and to a daily log file.
+
+    Records are pushed to a queue and written by a background listener thread, so logging calls inside the
+    solvers' loops don't block on console or file I/O. Calling it again reuses the running listener.
+
+    :param log_base_dir: The folder where the log file is created
+    :param stream_level: The minimum level sent to the console
+    :param file_level: The minimum level sent to the log file
+    :return: The QueueListener that writes the records
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+
+    if os.path.isdir(log_base_dir) is False:
+        os.makedirs(log_base_dir)
+    log_filename = os.path.join(log_base_dir, 'SIN5026Analyzer_{tm}.log'.format(tm=dt.datetime.now().date().strftime('%Y%m%d')))
+
+    formatter_stream_file = logging.Formatter('[*] %(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    log_stream_handler = logging.StreamHandler()
+    log_stream_handler.setLevel(stream_level)
+    log_stream_handler.setFormatter(formatter_stream_file)
+    log_file_handler = logging.FileHandler(log_filename)
+    log_file_handler.setLevel(file_level)
+    log_file_handler.setFormatter(formatter_stream_file)
+
+    log_queue = queue.SimpleQueue()
+    log_queue_handler = logging.handlers.QueueHandler(log_queue)
+    _log_listener = logging.handlers.QueueListener(log_queue, log_stream_handler, log_file_handler, respect_handler_level=True)
+
+    log.setLevel(min(stream_level, file_level))
+    log.addHandler(log_queue_handler)
+    _log_listener.start()
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+    return _log_listener
+
+
+def shutdown_logging():
+    """Flush any queued records and stop the background logging thread."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in log.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            log.removeHandler(handler)
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
@@ -1,10 +1,5 @@
-from SIN5026Analyzer.generator import RandomGenerator
-from SIN5026Analyzer.ga.solver import Solver as GASolver
-from SIN5026Analyzer.ilp.solver import Solver as ILPSolver
 from SIN5026Analyzer import log
-from solver.algorithms.default.proof import GASelections
 from os import path, mkdir
-import pandas as pd
 
 
 def compare(executions_amount: int, clients_amount: int = 40, products_amount: int = 50, max_orders_per_client: int = 10):
@@ -17,6 +12,13 @@ def compare(executions_amount: int, clients_amount: int = 40, products_amount: i
     :param max_orders_per_client: The amount of maximum lines for each order request
     :return: A DataFrame with a summary of sent/missing of each execution
     """
+    # The solver backends (CUDA GA, Gurobi) and pandas are only loaded when a comparison is actually run
+    import pandas as pd
+    from solver.algorithms.default.proof import GASelections
+    from SIN5026Analyzer.generator import RandomGenerator
+    from SIN5026Analyzer.ga.solver import Solver as GASolver
+    from SIN5026Analyzer.ilp.solver import Solver as ILPSolver
+
     log.info(f'======COMPARING {executions_amount} RANDOM EXECUTIONS======')
     comparable_results = pd.DataFrame()
 